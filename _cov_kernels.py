@@ -0,0 +1,90 @@
+"""
+Jitted numeric kernels for coverage collection hot paths
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Fall back to the pure-Python implementations when numba is not installed
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        def wrap(func):
+            return func
+        return wrap
+
+# Classification codes returned by classify_matrix, index into CLASS_LABELS
+CLASS_LABELS = ("identity", "diagonal", "triangular_upper", "triangular_lower", "general")
+
+# Bucket codes returned by bucket_values, index into VALUE_BIN_LABELS
+VALUE_BIN_LABELS = ("min", "max", "small", "medium", "large")
+
+@njit(cache=True)
+def classify_matrix(m):
+    """Classify an (n,n) int array: 0=identity, 1=diagonal, 2=upper, 3=lower, 4=general"""
+    n = m.shape[0]
+
+    # Single fused pass updating all four structure flags per cell, bailing
+    # out as soon as nonzeros on both sides of the diagonal rule out every
+    # structured shape - the common case for random input
+    is_identity = True
+    is_diagonal = True
+    is_upper = True
+    is_lower = True
+    for i in range(n):
+        for j in range(n):
+            v = m[i, j]
+            if i == j:
+                if v != 1:
+                    is_identity = False
+            elif v != 0:
+                is_identity = False
+                is_diagonal = False
+                if i > j:
+                    is_upper = False
+                else:
+                    is_lower = False
+                if not (is_upper or is_lower):
+                    return 4
+
+    if is_identity:
+        return 0
+    if is_diagonal:
+        return 1
+    if is_upper:
+        return 2
+    if is_lower:
+        return 3
+    return 4
+
+@njit(cache=True)
+def det3_batch(mats):
+    """Determinants of an (n,3,3) int64 array, one C-level cofactor expansion per matrix"""
+    out = np.empty(mats.shape[0], dtype=np.int64)
+    for k in range(mats.shape[0]):
+        a = mats[k]
+        out[k] = (a[0, 0] * (a[1, 1] * a[2, 2] - a[1, 2] * a[2, 1])
+                  - a[0, 1] * (a[1, 0] * a[2, 2] - a[1, 2] * a[2, 0])
+                  + a[0, 2] * (a[1, 0] * a[2, 1] - a[1, 1] * a[2, 0]))
+    return out
+
+@njit(cache=True)
+def bucket_values(values, min_value, max_value):
+    """Count values per range bin, returning counts in VALUE_BIN_LABELS order"""
+    counts = np.zeros(5, dtype=np.int64)
+    for k in range(values.shape[0]):
+        v = values[k]
+        if v == min_value:
+            counts[0] += 1
+        elif v == max_value:
+            counts[1] += 1
+        else:
+            magnitude = -v if v < 0 else v
+            if magnitude <= 1000:
+                counts[2] += 1
+            elif magnitude <= 10000:
+                counts[3] += 1
+            else:
+                counts[4] += 1
+    return counts
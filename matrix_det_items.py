@@ -1,64 +1,88 @@
-"""
-Matrix Determinant Transaction Items
-"""
-import pyuvm
-from pyuvm import *
-import random
-from matrix_det_types import *
-
-class MatrixItem(uvm_sequence_item):
-    """Input matrix item containing 3x3 matrix and delays"""
-    
-    def __init__(self, name="MatrixItem"):
-        super().__init__(name)
-        # 3x3 matrix of signed 16-bit values
-        self.matrix = [[0 for _ in range(MAT_MATRIX_SIZE)] for _ in range(MAT_MATRIX_SIZE)]
-        # Delay before each element
-        self.pre_element_delay = [[0 for _ in range(MAT_MATRIX_SIZE)] for _ in range(MAT_MATRIX_SIZE)]
-        
-    def randomize(self):
-        """Randomize matrix values and delays"""
-        for i in range(MAT_MATRIX_SIZE):
-            for j in range(MAT_MATRIX_SIZE):
-                # Random signed 16-bit values
-                self.matrix[i][j] = random.randint(MAT_UNDERFLOW_VALUE, MAT_OVERFLOW_VALUE)
-                # Random delays
-                self.pre_element_delay[i][j] = random.randint(0, 10)
-        return True
-        
-    def determinant_of_matrix(self):
-        """Calculate determinant of 3x3 matrix using cofactor expansion"""
-        mat = self.matrix
-        det = (mat[0][0] * mat[1][1] * mat[2][2] + 
-               mat[0][1] * mat[1][2] * mat[2][0] + 
-               mat[0][2] * mat[1][0] * mat[2][1] - 
-               mat[0][2] * mat[1][1] * mat[2][0] - 
-               mat[0][1] * mat[1][0] * mat[2][2] - 
-               mat[0][0] * mat[1][2] * mat[2][1])
-        return det
-        
-    def convert2string(self):
-        """Convert item to string representation"""
-        result = f"Matrix: {self.matrix}\n"
-        result += f"Delays: {self.pre_element_delay}\n"
-        result += f"Expected Det: {self.determinant_of_matrix()}"
-        return result
-    
-    def __str__(self):
-        return self.convert2string()
-
-class DeterminantItem(uvm_sequence_item):
-    """Output determinant item"""
-    
-    def __init__(self, name="DeterminantItem"):
-        super().__init__(name)
-        self.determinant = 0
-        self.overflow = False
-        self.pre_det_delay = 0
-        
-    def convert2string(self):
-        """Convert item to string representation"""
-        return f"Det: {self.determinant}, Overflow: {self.overflow}, Delay: {self.pre_det_delay}"
-    
-    def __str__(self):
+"""
+Matrix Determinant Transaction Items
+"""
+import pyuvm
+from pyuvm import *
+import random
+import numpy as np
+from matrix_det_types import *
+
+# Levi-Civita tensor, built once, for the closed-form 3x3 determinant contraction
+_EPS = np.zeros((3, 3, 3), dtype=np.int64)
+_EPS[0, 1, 2] = _EPS[1, 2, 0] = _EPS[2, 0, 1] = 1
+_EPS[0, 2, 1] = _EPS[2, 1, 0] = _EPS[1, 0, 2] = -1
+
+class MatrixItem(uvm_sequence_item):
+    """Input matrix item containing 3x3 matrix and delays"""
+
+    # The pyuvm base still carries a __dict__, so this does not drop the dict
+    # itself, but the payload fields get direct slot-descriptor access
+    __slots__ = ("matrix", "pre_element_delay", "_det_cache")
+
+    def __init__(self, name="MatrixItem"):
+        super().__init__(name)
+        # 3x3 matrix of signed 16-bit values - int16 matches the bus width exactly
+        self.matrix = np.zeros((MAT_MATRIX_SIZE, MAT_MATRIX_SIZE), dtype=np.int16)
+        # Delay before each element - small non-negative counts fit in uint8
+        self.pre_element_delay = np.zeros((MAT_MATRIX_SIZE, MAT_MATRIX_SIZE), dtype=np.uint8)
+        # Lazily computed determinant - valid until the next randomize
+        self._det_cache = None
+
+    def randomize(self):
+        """Randomize matrix values and delays"""
+        self._det_cache = None
+        # Single C-level RNG call per field instead of 9 Python calls each
+        self.matrix[:] = np.random.randint(
+            MAT_UNDERFLOW_VALUE, MAT_OVERFLOW_VALUE + 1,
+            size=(MAT_MATRIX_SIZE, MAT_MATRIX_SIZE), dtype=np.int16)
+        self.pre_element_delay[:] = np.random.randint(
+            0, 11, size=(MAT_MATRIX_SIZE, MAT_MATRIX_SIZE), dtype=np.uint8)
+        return True
+
+    def determinant_of_matrix(self):
+        """Calculate determinant of 3x3 matrix via a cached Levi-Civita contraction
+
+        The result is memoized - the matrix is not expected to change after
+        randomize, and convert2string calls this on every logged message.
+        """
+        if self._det_cache is not None:
+            return self._det_cache
+        # Widen to int64 so the products cannot wrap in 32-bit arithmetic
+        mat = np.asarray(self.matrix, dtype=np.int64)
+        if mat.shape != (3, 3):
+            # Generic fallback should MAT_MATRIX_SIZE ever change
+            det = int(round(np.linalg.det(mat)))
+        else:
+            # det = eps_ijk * m[i,0] * m[j,1] * m[k,2] - exact integer arithmetic
+            det = int(np.einsum('ijk,i,j,k->', _EPS, mat[:, 0], mat[:, 1], mat[:, 2]))
+        self._det_cache = det
+        return det
+
+    def convert2string(self):
+        """Convert item to string representation"""
+        # Single join allocates the result once instead of growing via +=
+        return "\n".join((
+            f"Matrix: {self.matrix.tolist()}",
+            f"Delays: {self.pre_element_delay.tolist()}",
+            f"Expected Det: {self.determinant_of_matrix()}"))
+    
+    def __str__(self):
+        return self.convert2string()
+
+class DeterminantItem(uvm_sequence_item):
+    """Output determinant item"""
+
+    __slots__ = ("determinant", "overflow", "pre_det_delay")
+
+    def __init__(self, name="DeterminantItem"):
+        super().__init__(name)
+        self.determinant = 0
+        self.overflow = False
+        self.pre_det_delay = 0
+        
+    def convert2string(self):
+        """Convert item to string representation"""
+        return f"Det: {self.determinant}, Overflow: {self.overflow}, Delay: {self.pre_det_delay}"
+    
+    def __str__(self):
         return self.convert2string()
\ No newline at end of file
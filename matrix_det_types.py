@@ -1,32 +1,40 @@
-"""
-Matrix Determinant Types and Constants
-"""
-from enum import Enum
-import pyuvm
-from pyuvm import *
-
-# Matrix and bus width constants
-MAT_BUS_WIDTH = 16
-MAT_MATRIX_SIZE = 3
-DET_BUS_WIDTH = 16
-
-# Value limits for signed 16-bit bus
-MAT_UNDERFLOW_VALUE = -(2 ** (MAT_BUS_WIDTH - 1))
-MAT_OVERFLOW_VALUE = (2 ** (MAT_BUS_WIDTH - 1)) - 1
-DET_UNDERFLOW_VALUE = -(2 ** (DET_BUS_WIDTH - 1))
-DET_OVERFLOW_VALUE = (2 ** (DET_BUS_WIDTH - 1)) - 1
-
-class ResetStages(Enum):
-    BEFORE_PACKET = "BEFORE_PACKET"
-    DURING_PACKET = "DURING_PACKET"
-    DURING_BACKPRESSURE = "DURING_BACKPRESSURE"
-
-class TriangularType(Enum):
-    NOT_TRIANGULAR = "NOT_TRIANGULAR"
-    UPPER = "UPPER"
-    LOWER = "LOWER"
-
-class PermutationType(Enum):
-    NOT_PERMUTATION = "NOT_PERMUTATION"
-    IDENTITY = "IDENTITY"
+"""
+Matrix Determinant Types and Constants
+"""
+from enum import Enum
+import pyuvm
+from pyuvm import *
+
+# Matrix and bus width constants
+MAT_BUS_WIDTH = 16
+MAT_MATRIX_SIZE = 3
+DET_BUS_WIDTH = 16
+
+# Value limits for signed 16-bit bus
+MAT_UNDERFLOW_VALUE = -(2 ** (MAT_BUS_WIDTH - 1))
+MAT_OVERFLOW_VALUE = (2 ** (MAT_BUS_WIDTH - 1)) - 1
+DET_UNDERFLOW_VALUE = -(2 ** (DET_BUS_WIDTH - 1))
+DET_OVERFLOW_VALUE = (2 ** (DET_BUS_WIDTH - 1)) - 1
+
+# Testbench clock period (see clock generation in test_matrix_det)
+CLK_PERIOD_NS = 10
+
+# Flattened (row, col) traversal order, precomputed since the matrix size is fixed
+MAT_INDICES = tuple((i, j)
+                    for i in range(MAT_MATRIX_SIZE)
+                    for j in range(MAT_MATRIX_SIZE))
+
+class ResetStages(Enum):
+    BEFORE_PACKET = "BEFORE_PACKET"
+    DURING_PACKET = "DURING_PACKET"
+    DURING_BACKPRESSURE = "DURING_BACKPRESSURE"
+
+class TriangularType(Enum):
+    NOT_TRIANGULAR = "NOT_TRIANGULAR"
+    UPPER = "UPPER"
+    LOWER = "LOWER"
+
+class PermutationType(Enum):
+    NOT_PERMUTATION = "NOT_PERMUTATION"
+    IDENTITY = "IDENTITY"
     PERMUTATION = "PERMUTATION"
\ No newline at end of file